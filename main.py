@@ -1,14 +1,22 @@
 import sys
 import json
 import os
+import struct
 import re
+import codecs
+import threading
+import bisect
+import multiprocessing
+from array import array
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QFileDialog, QLineEdit, QListWidget, QLabel,
     QMessageBox, QSplitter, QMenu, QAction, QTextBrowser
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
 from striprtf.striprtf import rtf_to_text
 import nltk
 from nltk.tokenize import sent_tokenize, word_tokenize
@@ -17,6 +25,14 @@ import pymorphy3
 
 # Загрузка необходимых данных NLTK
 def setup_nltk():
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        nltk.download('stopwords')
+
+
+# Модель punkt нужна только при разбиении на предложения через NLTK
+def setup_punkt():
     try:
         nltk.data.find('tokenizers/punkt')
     except LookupError:
@@ -26,23 +42,136 @@ def setup_nltk():
         nltk.data.find('tokenizers/punkt/russian.pickle')
     except LookupError:
         nltk.download('punkt')
-    
-    try:
-        nltk.data.find('corpora/stopwords')
-    except LookupError:
-        nltk.download('stopwords')
 
-setup_nltk()
+# Данные NLTK и морфологический анализатор загружаются при первом обращении
+# (или заранее в фоне из LexiconEditor), а не при импорте модуля
+_lazy_lock = threading.Lock()
+_nltk_ready = False
+_morph = None
+
+
+def ensure_nltk():
+    """Однократная подготовка данных NLTK"""
+    global _nltk_ready
+    with _lazy_lock:
+        if not _nltk_ready:
+            setup_nltk()
+            # Неудачная загрузка (например, без сети) не фиксируется —
+            # следующий вызов попробует снова
+            nltk.data.find('corpora/stopwords')
+            _nltk_ready = True
+
+
+def get_morph():
+    """Общий морфологический анализатор (создаётся при первом обращении)"""
+    global _morph
+    if _morph is None:
+        with _lazy_lock:
+            if _morph is None:
+                _morph = pymorphy3.MorphAnalyzer()
+    return _morph
+
+
+# Артефакты лемматизации частиц
+_ARTIFACTS = frozenset({'нибыть', 'либыть', 'тобыть', 'кое'})
+
+
+@lru_cache(maxsize=None)
+def get_stopwords():
+    """Стоп-слова NLTK, расширенные частицами и артефактами"""
+    ensure_nltk()
+    return frozenset(stopwords.words('russian')) | {
+        'бы', 'же', 'ли', 'быть', 'нибудь', 'кое', 'то', 'либо', 'таки',
+        'нибыть', 'либыть', 'тобыть', 'когда-нибудь', 'где-нибудь'
+    }
+
+
+@lru_cache(maxsize=None)
+def get_excluded():
+    """Леммы, которые не могут быть лексемами словаря"""
+    return get_stopwords() | _ARTIFACTS
+
+
+# Знаменательные части речи
+_CONTENT_POS = frozenset({'NOUN', 'VERB', 'INFN', 'ADJF', 'ADJS', 'PRTF', 'PRTS'})
+
+# Токенизация с сохранением дефисных слов (например, "когда-нибудь")
+_WORD_RE = re.compile(r'\b[а-яё]+(?:-[а-яё]+)*\b')
+
+# Разбиение на предложения: текст до знаков конца предложения (или до конца текста).
+# Для словосочетаний важны только границы предложений, поэтому точности
+# регулярного выражения достаточно; NLTK punkt можно включить флагом.
+_SENT_RE = re.compile(r'[^.!?…]+(?:[.!?…]+|$)')
+USE_NLTK_SENT_TOKENIZE = False
+
+# Кодовая страница RTF из заголовка (\ansicpg1251); русские RTF обычно в cp1251
+_ANSICPG_RE = re.compile(rb'\\ansicpg(\d+)')
+RTF_DEFAULT_ENCODING = 'cp1251'
 
-# Загрузка стоп-слов и морфологического анализатора
-russian_stopwords = set(stopwords.words('russian'))
-# Расширяем стоп-слова для частиц и артефактов
-russian_stopwords.update({
-    'бы', 'же', 'ли', 'быть', 'нибудь', 'кое', 'то', 'либо', 'таки',
-    'нибыть', 'либыть', 'тобыть', 'когда-нибудь', 'где-нибудь'
-})
+@lru_cache(maxsize=200000)
+def _analyze(word: str) -> Tuple[Optional[str], Optional[str]]:
+    """Лемма и часть речи для словоформы (самый вероятный разбор, с кэшем).
+    Леммы интернируются: одинаковые строки в словаре разделяют один объект."""
+    parses = get_morph().parse(word)
+    if not parses:
+        return None, None
+    parsed = max(parses, key=lambda p: p.score)
+    return sys.intern(parsed.normal_form.lower()), parsed.tag.POS
 
-morph = pymorphy3.MorphAnalyzer()
+
+# Параллельная обработка включается только для больших текстов. Процессы
+# запускаются через spawn: каждый заново импортирует main.py (PyQt5, NLTK,
+# pymorphy3) и создаёт свой MorphAnalyzer — порядка 1-2 с на процесс
+# (сам запуск пула spawn без этих импортов — около 0,1 с). Последовательная
+# обработка 1000 предложений с анализом уникальных форм занимает меньше,
+# поэтому порог выбран с запасом.
+PARALLEL_MIN_SENTENCES = 10000
+PARALLEL_CHUNK_SIZE = 500
+
+
+def _process_sentences(sentences: List[str]) -> Dict[str, Set[str]]:
+    """Извлечение словосочетаний из списка предложений (выполняется и в дочерних процессах)"""
+    colloc_dict: Dict[str, Set[str]] = defaultdict(set)
+    stop_words = get_stopwords()
+    excluded = get_excluded()
+
+    # Первый проход: словоформы предложений и словарь уникальных форм
+    sent_words: List[List[str]] = []
+    vocab: Set[str] = set()
+    for sent in sentences:
+        words = []
+        for match in _WORD_RE.finditer(sent):
+            word = match.group()
+            # Пропускаем короткие слова и стоп-слова
+            if len(word) >= 4 and word not in stop_words:
+                words.append(word)
+        sent_words.append(words)
+        vocab.update(words)
+
+    # Второй проход: морфологический анализ каждой уникальной формы один раз
+    lemma_map: Dict[str, str] = {}
+    for word in vocab:
+        lemma, pos = _analyze(word)
+        # Фильтрация артефактов частиц; только знаменательные части речи
+        if lemma is not None and lemma not in excluded and pos in _CONTENT_POS:
+            lemma_map[word] = lemma
+
+    # Третий проход: леммы предложений по готовому словарю форм
+    for words in sent_words:
+        lemmas: List[str] = [lemma_map[w] for w in words if w in lemma_map]
+
+        # Построение биграмм ТОЛЬКО внутри предложения
+        for a, b in zip(lemmas, lemmas[1:]):
+            if a != b and len(a) >= 4 and len(b) >= 4:
+                colloc_dict[a].add(b)
+                colloc_dict[b].add(a)
+
+    return dict(colloc_dict)
+
+
+def _chunks(items, size):
+    """Разбиение списка на части фиксированного размера"""
+    return [items[i:i + size] for i in range(0, len(items), size)]
 
 class TextProcessor:
     """Обработка текста: извлечение лексем и словосочетаний с учётом границ предложений"""
@@ -52,8 +181,10 @@ class TextProcessor:
         """Чтение TXT или RTF файла"""
         ext = filepath.lower().split('.')[-1]
         if ext == 'rtf':
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                return rtf_to_text(f.read())
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            encoding = TextProcessor.detect_rtf_encoding(raw)
+            return rtf_to_text(raw.decode(encoding, errors='replace'), encoding=encoding, errors='replace')
         elif ext == 'txt':
             with open(filepath, 'r', encoding='utf-8') as f:
                 return f.read()
@@ -61,7 +192,20 @@ class TextProcessor:
             raise ValueError("Поддерживаются только .txt и .rtf файлы")
     
     @staticmethod
-    def extract_collocations(text):
+    def detect_rtf_encoding(raw):
+        """Кодировка RTF по тегу \\ansicpg в начале заголовка"""
+        match = _ANSICPG_RE.search(raw, 0, 4096)
+        if match:
+            encoding = f"cp{match.group(1).decode('ascii')}"
+            try:
+                codecs.lookup(encoding)
+                return encoding
+            except LookupError:
+                pass
+        return RTF_DEFAULT_ENCODING
+    
+    @staticmethod
+    def extract_collocations(text: str) -> Dict[str, Set[str]]:
         """
         Извлечение лингвистически корректных словосочетаний.
         Ключевые улучшения:
@@ -71,47 +215,148 @@ class TextProcessor:
         4. Только знаменательные части речи
         """
         # Разбиваем текст на предложения с поддержкой русского языка
-        sentences = sent_tokenize(text.lower(), language='russian')
-        colloc_dict = defaultdict(set)
-        
-        for sent in sentences:
-            # Токенизация с сохранением дефисных слов (например, "когда-нибудь")
-            words = re.findall(r'\b[а-яё]+(?:-[а-яё]+)*\b', sent)
-            
-            lemmas = []
-            for word in words:
-                # Пропускаем короткие слова и стоп-слова
-                if len(word) < 4 or word in russian_stopwords:
-                    continue
-                
-                # Морфологический анализ
-                parses = morph.parse(word)
-                if not parses:
-                    continue
-                
-                # Выбираем самый вероятный разбор
-                parsed = max(parses, key=lambda p: p.score)
-                pos = parsed.tag.POS
-                lemma = parsed.normal_form.lower()
-                
-                # Фильтрация артефактов частиц
-                if lemma in {'нибыть', 'либыть', 'тобыть', 'кое'} or lemma in russian_stopwords:
-                    continue
-                
-                # Только знаменательные части речи
-                if pos in {'NOUN', 'VERB', 'INFN', 'ADJF', 'ADJS', 'PRTF', 'PRTS'}:
-                    lemmas.append(lemma)
-            
-            # Построение биграмм ТОЛЬКО внутри предложения
-            for i in range(len(lemmas) - 1):
-                a, b = lemmas[i], lemmas[i + 1]
-                if a != b and len(a) >= 4 and len(b) >= 4:
-                    colloc_dict[a].add(b)
-                    colloc_dict[b].add(a)
+        text = text.lower()
+        if USE_NLTK_SENT_TOKENIZE:
+            setup_punkt()
+            sentences = sent_tokenize(text, language='russian')
+        else:
+            sentences = _SENT_RE.findall(text) or [text]
+        if len(sentences) <= PARALLEL_MIN_SENTENCES:
+            return _process_sentences(sentences)
+
+        # Данные NLTK и анализатор готовятся до запуска процессов: вызов дожидается
+        # фонового прогрева (WarmupWorker), и дочерние процессы не скачивают
+        # данные NLTK одновременно в один каталог
+        get_excluded()
+        get_morph()
+
+        # Большой текст: предложения обрабатываются пачками в отдельных процессах.
+        # Вызов идёт из потока QThreadPool, поэтому процессы запускаются через spawn:
+        # fork скопировал бы в дочерние процессы блокировки, занятые другими потоками
+        chunks = _chunks(sentences, PARALLEL_CHUNK_SIZE)
+        ctx = multiprocessing.get_context('spawn')
+        with ctx.Pool(processes=min(os.cpu_count() or 1, len(chunks))) as pool:
+            results = pool.map(_process_sentences, chunks)
+
+        # Строки из дочерних процессов приходят копиями — интернируем их заново
+        colloc_dict: Dict[str, Set[str]] = defaultdict(set)
+        for partial in results:
+            for lemma, partners in partial.items():
+                colloc_dict[sys.intern(lemma)].update(map(sys.intern, partners))
+
+        return dict(colloc_dict)
+
+
+class LexiconStorage:
+    """Двоичный формат словаря (*.lex): заголовок, таблица лексем в UTF-8
+    через '\\n' и плоский массив пар индексов uint32 (little-endian)"""
+    
+    MAGIC = b'LEXDICT1'
+    HEADER = struct.Struct('<8sII')  # сигнатура, размер таблицы в байтах, число индексов
+    
+    @staticmethod
+    def save(lexicon, filepath):
+        """Сохранение словаря (каждая связь записывается один раз)"""
+        lemmas = sorted(lexicon)
+        index = {lemma: i for i, lemma in enumerate(lemmas)}
+        pairs = array('I')
+        for lemma, partners in lexicon.items():
+            i = index[lemma]
+            for partner in partners:
+                j = index[partner]
+                if i < j:
+                    pairs.append(i)
+                    pairs.append(j)
+        
+        if sys.byteorder == 'big':
+            pairs.byteswap()
+        
+        table = '\n'.join(lemmas).encode('utf-8')
+        with open(filepath, 'wb') as f:
+            f.write(LexiconStorage.HEADER.pack(LexiconStorage.MAGIC, len(table), len(pairs)))
+            f.write(table)
+            f.write(pairs.tobytes())
+    
+    @staticmethod
+    def load(filepath):
+        """Загрузка словаря в виде {lemma: set(partners)} с проверкой формата"""
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        
+        header_size = LexiconStorage.HEADER.size
+        if len(data) < header_size:
+            raise ValueError("Файл не является словарём: слишком короткий")
+        magic, table_size, pair_count = LexiconStorage.HEADER.unpack_from(data)
+        if magic != LexiconStorage.MAGIC:
+            raise ValueError("Файл не является словарём: неверная сигнатура")
+        
+        pairs = array('I')
+        if pairs.itemsize != 4:
+            raise ValueError("Платформа не поддерживает 32-битные индексы array('I')")
+        pairs_start = header_size + table_size
+        if pair_count % 2 or len(data) != pairs_start + pair_count * 4:
+            raise ValueError("Файл словаря повреждён: неверный размер данных")
+        
+        table = data[header_size:pairs_start].decode('utf-8')
+        lemmas = [sys.intern(lemma) for lemma in table.split('\n')] if table else []
+        pairs.frombytes(data[pairs_start:])
+        if sys.byteorder == 'big':
+            pairs.byteswap()
+        if pairs and max(pairs) >= len(lemmas):
+            raise ValueError("Файл словаря повреждён: индекс лексемы вне таблицы")
         
+        colloc_dict = defaultdict(set)
+        for k in range(0, len(pairs), 2):
+            a, b = lemmas[pairs[k]], lemmas[pairs[k + 1]]
+            colloc_dict[a].add(b)
+            colloc_dict[b].add(a)
         return dict(colloc_dict)
 
 
+class LoadSignals(QObject):
+    """Сигналы фоновой загрузки (QRunnable сам сигналы испускать не может)"""
+    # object, а не dict: иначе PyQt конвертирует словарь в QVariantMap и обратно в GUI-потоке
+    finished = pyqtSignal(str, object)  # путь к файлу, словосочетания
+    error = pyqtSignal(str)
+
+
+class LoadWorker(QRunnable):
+    """Чтение файла и извлечение словосочетаний (или загрузка словаря) вне GUI-потока"""
+    
+    def __init__(self, filepath):
+        super().__init__()
+        self.filepath = filepath
+        self.signals = LoadSignals()
+    
+    def run(self):
+        try:
+            if self.filepath.lower().endswith('.lex'):
+                new_collocs = LexiconStorage.load(self.filepath)
+            else:
+                text = TextProcessor.read_file(self.filepath)
+                if not text.strip():
+                    raise ValueError("Файл пустой или содержит только пробельные символы")
+                
+                new_collocs = TextProcessor.extract_collocations(text)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(self.filepath, new_collocs)
+
+
+class WarmupWorker(QRunnable):
+    """Фоновая загрузка данных NLTK и анализатора, пока отрисовывается окно"""
+    
+    def run(self):
+        # Исключение в QRunnable.run аварийно завершает приложение; ошибку
+        # покажет фактическая загрузка файла через LoadWorker
+        try:
+            get_stopwords()
+            get_morph()
+        except Exception:
+            pass
+
+
 class LexiconEditor(QMainWindow):
     """Основное окно приложения — словарь словосочетаний"""
     
@@ -119,9 +364,14 @@ class LexiconEditor(QMainWindow):
         super().__init__()
         self.setWindowTitle("Лабораторная №1 — Словарь словосочетаний (Вариант 7, Задание 3)")
         self.resize(1000, 650)
-        self.lexicon = {}  # {lemma: set(partners)}
+        # {lemma: tuple(sorted partners)}; все леммы в нижнем регистре.
+        # Словарь в основном читается, поэтому партнёры хранятся отсортированными кортежами
+        self.lexicon = {}
+        self._sorted_lexemes = []  # отсортированные ключи self.lexicon
+        self._load_worker = None  # текущая фоновая загрузка
         self.init_ui()
         self.create_menu()
+        QThreadPool.globalInstance().start(WarmupWorker())
     
     def init_ui(self):
         central = QWidget()
@@ -130,8 +380,8 @@ class LexiconEditor(QMainWindow):
         
         # Панель управления
         btn_layout = QHBoxLayout()
-        self.btn_load = QPushButton("Загрузить TXT/RTF")
-        self.btn_save = QPushButton("Сохранить словарь (JSON)")
+        self.btn_load = QPushButton("Загрузить TXT/RTF/LEX")
+        self.btn_save = QPushButton("Сохранить словарь (JSON/LEX)")
         self.btn_document = QPushButton("Документировать (отчёт)")
         self.btn_clear = QPushButton("Очистить всё")
         
@@ -147,6 +397,12 @@ class LexiconEditor(QMainWindow):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Введите часть лексемы для фильтрации...")
         self.search_input.textChanged.connect(self.filter_lexemes)
+        
+        # Отложенная фильтрация: быстрый ввод схлопывается в одно обновление
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(self.update_lexeme_list)
         search_layout.addWidget(self.search_input)
         layout.addLayout(search_layout)
         
@@ -209,55 +465,76 @@ class LexiconEditor(QMainWindow):
         help_menu.addAction(about_action)
     
     def load_file(self):
-        """Загрузка и обработка текстового файла"""
+        """Загрузка и обработка текстового файла или сохранённого словаря"""
         filepath, _ = QFileDialog.getOpenFileName(
-            self, "Открыть файл", "", "Текстовые файлы (*.txt *.rtf)"
+            self, "Открыть текст или словарь", "",
+            "Текст или словарь (*.txt *.rtf *.lex);;Текстовые файлы (*.txt *.rtf);;Сохранённый словарь (*.lex)"
         )
         if not filepath:
             return
         
-        try:
-            text = TextProcessor.read_file(filepath)
-            if not text.strip():
-                raise ValueError("Файл пустой или содержит только пробельные символы")
-            
-            new_collocs = TextProcessor.extract_collocations(text)
-            
-            # Объединение с существующим словарём
-            for lemma, partners in new_collocs.items():
-                if lemma not in self.lexicon:
-                    self.lexicon[lemma] = set()
-                self.lexicon[lemma].update(partners)
-            
-            self.update_lexeme_list()
-            total_new = len([l for l in new_collocs if l not in self.lexicon or len(self.lexicon[l]) > 0])
-            self.statusBar().showMessage(
-                f"Файл '{os.path.basename(filepath)}' обработан: {len(new_collocs)} лексем, {sum(len(v) for v in new_collocs.values())//2} связей"
-            )
-            QMessageBox.information(
-                self, "Успех", 
-                f"Текст успешно обработан!\nДобавлено лексем: {len(new_collocs)}\nДобавлено связей: {sum(len(v) for v in new_collocs.values())//2}"
-            )
-        except Exception as e:
-            QMessageBox.critical(self, "Ошибка обработки", f"Не удалось обработать файл:\n{str(e)}")
-            self.statusBar().showMessage(f"Ошибка: {str(e)}")
+        # Обработка выполняется в пуле потоков, интерфейс остаётся отзывчивым
+        self._set_loading(True)
+        self.statusBar().showMessage(f"Обработка файла '{os.path.basename(filepath)}'...")
+        self._load_worker = LoadWorker(filepath)
+        self._load_worker.signals.finished.connect(self.on_load_finished)
+        self._load_worker.signals.error.connect(self.on_load_error)
+        QThreadPool.globalInstance().start(self._load_worker)
+    
+    def on_load_finished(self, filepath, new_collocs):
+        """Объединение результатов фоновой обработки со словарём"""
+        self._set_loading(False)
+        self._load_worker = None
+        
+        # Объединение с существующим словарём
+        for lemma, partners in new_collocs.items():
+            if lemma in self.lexicon:
+                partners = partners.union(self.lexicon[lemma])
+            self.lexicon[lemma] = tuple(sorted(partners))
+        
+        self._sorted_lexemes = sorted(self.lexicon)
+        self.update_lexeme_list()
+        self.statusBar().showMessage(
+            f"Файл '{os.path.basename(filepath)}' обработан: {len(new_collocs)} лексем, {sum(len(v) for v in new_collocs.values())//2} связей"
+        )
+        done = "Словарь успешно загружен!" if filepath.lower().endswith('.lex') else "Текст успешно обработан!"
+        QMessageBox.information(
+            self, "Успех", 
+            f"{done}\nДобавлено лексем: {len(new_collocs)}\nДобавлено связей: {sum(len(v) for v in new_collocs.values())//2}"
+        )
+    
+    def on_load_error(self, message):
+        """Сообщение об ошибке фоновой обработки"""
+        self._set_loading(False)
+        self._load_worker = None
+        QMessageBox.critical(self, "Ошибка обработки", f"Не удалось обработать файл:\n{message}")
+        self.statusBar().showMessage(f"Ошибка: {message}")
+    
+    def _set_loading(self, loading):
+        """Блокировка загрузки и редактирования на время фоновой обработки,
+        чтобы результат не объединялся с уже очищенным или изменённым словарём"""
+        for button in (self.btn_load, self.btn_clear, self.btn_add, self.btn_remove):
+            button.setEnabled(not loading)
     
     def update_lexeme_list(self):
         """Обновление списка лексем с учётом поиска"""
-        self.lexeme_list.clear()
+        self.filter_timer.stop()
         search_text = self.search_input.text().lower().strip()
         
-        lemmas = sorted(self.lexicon.keys())
+        lemmas = self._sorted_lexemes
         if search_text:
-            lemmas = [l for l in lemmas if search_text in l.lower()]
+            # Леммы уже в нижнем регистре (см. _analyze), приводить их не нужно
+            lemmas = [l for l in lemmas if search_text in l]
         
-        for lemma in lemmas:
-            partners_count = len(self.lexicon[lemma])
-            self.lexeme_list.addItem(f"{lemma} ({partners_count} партнёров)")
+        # Пакетное заполнение без промежуточных перерисовок
+        self.lexeme_list.setUpdatesEnabled(False)
+        self.lexeme_list.clear()
+        self.lexeme_list.addItems([f"{l} ({len(self.lexicon[l])} партнёров)" for l in lemmas])
+        self.lexeme_list.setUpdatesEnabled(True)
     
     def filter_lexemes(self):
-        """Фильтрация при изменении поиска"""
-        self.update_lexeme_list()
+        """Фильтрация при изменении поиска (с задержкой на время ввода)"""
+        self.filter_timer.start()
     
     def show_partners(self):
         """Отображение партнёров выбранной лексемы"""
@@ -267,8 +544,9 @@ class LexiconEditor(QMainWindow):
             return
         
         lemma = items[0].text().split(' (')[0]
-        for partner in sorted(self.lexicon.get(lemma, [])):
-            self.partner_list.addItem(partner)
+        self.partner_list.setUpdatesEnabled(False)
+        self.partner_list.addItems(self.lexicon.get(lemma, ()))
+        self.partner_list.setUpdatesEnabled(True)
     
     def add_partner(self):
         """Добавление новой связи"""
@@ -277,34 +555,36 @@ class LexiconEditor(QMainWindow):
             QMessageBox.warning(self, "Внимание", "Сначала выберите лексему в левом списке.")
             return
         
-        lemma = items[0].text().split(' (')[0]
+        # Текст элемента списка — новая строка; интернируем, как и леммы из _analyze
+        lemma = sys.intern(items[0].text().split(' (')[0])
         partner_text = self.partner_input.text().strip().lower()
         if not partner_text or len(partner_text) < 4:
             QMessageBox.warning(self, "Внимание", "Партнёр должен содержать минимум 4 символа.")
             return
         
         # Лемматизация введённого слова
-        parses = morph.parse(partner_text)
-        if not parses:
+        partner_lemma, _ = _analyze(partner_text)
+        if partner_lemma is None:
             QMessageBox.warning(self, "Ошибка", f"Не удалось распознать слово '{partner_text}'")
             return
         
-        partner_lemma = max(parses, key=lambda p: p.score).normal_form.lower()
-        
         # Проверка на стоп-слова и артефакты
-        if partner_lemma in russian_stopwords or partner_lemma in {'нибыть', 'либыть', 'тобыть'}:
+        if partner_lemma in get_excluded():
             QMessageBox.warning(self, "Внимание", f"Лексема '{partner_lemma}' является служебной и не может быть партнёром.")
             return
         
+        assert partner_lemma == partner_lemma.lower(), partner_lemma
+        
         if lemma == partner_lemma:
             QMessageBox.warning(self, "Внимание", "Лексема не может быть партнёром самой себе.")
             return
         
         # Добавление двунаправленной связи
         if partner_lemma not in self.lexicon:
-            self.lexicon[partner_lemma] = set()
-        self.lexicon[lemma].add(partner_lemma)
-        self.lexicon[partner_lemma].add(lemma)
+            self.lexicon[partner_lemma] = ()
+            bisect.insort(self._sorted_lexemes, partner_lemma)
+        self._update_partners(lemma, add=partner_lemma)
+        self._update_partners(partner_lemma, add=lemma)
         
         self.partner_input.clear()
         self.show_partners()
@@ -322,35 +602,56 @@ class LexiconEditor(QMainWindow):
         lemma = lemma_item[0].text().split(' (')[0]
         partner = partner_item[0].text()
         
-        self.lexicon[lemma].discard(partner)
-        self.lexicon[partner].discard(lemma)
+        self._update_partners(lemma, discard=partner)
+        self._update_partners(partner, discard=lemma)
         
         # Удаление пустых записей
-        if lemma in self.lexicon and not self.lexicon[lemma]:
-            del self.lexicon[lemma]
-        if partner in self.lexicon and not self.lexicon[partner]:
-            del self.lexicon[partner]
+        for key in (lemma, partner):
+            if key in self.lexicon and not self.lexicon[key]:
+                del self.lexicon[key]
+                del self._sorted_lexemes[bisect.bisect_left(self._sorted_lexemes, key)]
         
         self.update_lexeme_list()
         self.show_partners()
         self.statusBar().showMessage(f"Связь удалена: '{lemma}' ↔ '{partner}'")
     
+    def _update_partners(self, lemma, add=None, discard=None):
+        """Изменение партнёров лексемы: кортеж временно превращается в множество"""
+        if lemma not in self.lexicon:
+            return
+        partners = set(self.lexicon[lemma])
+        if add is not None:
+            partners.add(add)
+        if discard is not None:
+            partners.discard(discard)
+        self.lexicon[lemma] = tuple(sorted(partners))
+    
     def save_lexicon(self):
-        """Сохранение словаря в JSON"""
+        """Сохранение словаря в JSON (экспорт) или в двоичный формат LEX"""
         if not self.lexicon:
             QMessageBox.warning(self, "Внимание", "Словарь пуст. Сначала загрузите текст.")
             return
         
-        filepath, _ = QFileDialog.getSaveFileName(
-            self, "Сохранить словарь", "словарь_словосочетаний.json", "JSON файлы (*.json)"
+        filepath, selected_filter = QFileDialog.getSaveFileName(
+            self, "Сохранить словарь", "словарь_словосочетаний.json",
+            "JSON файлы (*.json);;Двоичный словарь (*.lex)"
         )
         if not filepath:
             return
         
-        # Преобразование set → list для JSON
-        serializable = {k: sorted(list(v)) for k, v in self.lexicon.items()}
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(serializable, f, ensure_ascii=False, indent=2)
+        # Формат определяется выбранным фильтром или введённым расширением
+        binary = '*.lex' in selected_filter or filepath.lower().endswith('.lex')
+        if binary and not filepath.lower().endswith('.lex'):
+            filepath = os.path.splitext(filepath)[0] + '.lex'
+        
+        if binary:
+            # Быстрое компактное сохранение, файл можно снова открыть в программе
+            LexiconStorage.save(self.lexicon, filepath)
+        else:
+            # Преобразование tuple → list для JSON
+            serializable = {k: list(v) for k, v in self.lexicon.items()}
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(serializable, f, ensure_ascii=False, indent=2)
         
         QMessageBox.information(self, "Сохранено", f"Словарь сохранён в:\n{filepath}")
         self.statusBar().showMessage(f"Словарь сохранён: {filepath}")
@@ -367,23 +668,22 @@ class LexiconEditor(QMainWindow):
         if not filepath:
             return
         
-        # Формирование отчёта
-        report = "ДОКУМЕНТИРОВАННЫЙ СЛОВАРЬ СЛОВОСОЧЕТАНИЙ\n"
-        report += "=" * 70 + "\n"
-        report += f"Всего лексем: {len(self.lexicon)}\n"
-        report += f"Всего уникальных связей: {sum(len(v) for v in self.lexicon.values()) // 2}\n"
-        report += "=" * 70 + "\n\n"
-        report += "Примечание: Словосочетания извлекаются ТОЛЬКО в пределах одного предложения.\n"
-        report += "Лексемы — нормальные формы слов (например, 'книги' → 'книга').\n\n"
-        report += "=" * 70 + "\n\n"
-        
-        for i, lemma in enumerate(sorted(self.lexicon.keys()), 1):
-            partners = sorted(self.lexicon[lemma])
-            report += f"{i}. ЛЕКСЕМА: «{lemma}»\n"
-            report += f"   Партнёры ({len(partners)}): {', '.join(f'«{p}»' for p in partners)}\n\n"
-        
+        # Формирование отчёта: записи пишутся в файл по мере формирования,
+        # без накопления всего текста в памяти
         with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(report)
+            f.write("ДОКУМЕНТИРОВАННЫЙ СЛОВАРЬ СЛОВОСОЧЕТАНИЙ\n")
+            f.write("=" * 70 + "\n")
+            f.write(f"Всего лексем: {len(self.lexicon)}\n")
+            f.write(f"Всего уникальных связей: {sum(len(v) for v in self.lexicon.values()) // 2}\n")
+            f.write("=" * 70 + "\n\n")
+            f.write("Примечание: Словосочетания извлекаются ТОЛЬКО в пределах одного предложения.\n")
+            f.write("Лексемы — нормальные формы слов (например, 'книги' → 'книга').\n\n")
+            f.write("=" * 70 + "\n\n")
+            
+            for i, lemma in enumerate(self._sorted_lexemes, 1):
+                partners = self.lexicon[lemma]
+                f.write(f"{i}. ЛЕКСЕМА: «{lemma}»\n")
+                f.write(f"   Партнёры ({len(partners)}): {', '.join(f'«{p}»' for p in partners)}\n\n")
         
         QMessageBox.information(self, "Отчёт создан", f"Документированный отчёт сохранён:\n{filepath}")
         self.statusBar().showMessage(f"Отчёт сохранён: {filepath}")
@@ -401,6 +701,7 @@ class LexiconEditor(QMainWindow):
         )
         if reply == QMessageBox.Yes:
             self.lexicon.clear()
+            self._sorted_lexemes = []
             self.lexeme_list.clear()
             self.partner_list.clear()
             self.search_input.clear()
@@ -412,7 +713,7 @@ class LexiconEditor(QMainWindow):
             "<h3>Руководство пользователя: Словарь словосочетаний</h3>"
             
             "<p><b>1. Загрузка текста</b><br>"
-            "— Нажмите «Загрузить TXT/RTF» и выберите файл.<br>"
+            "— Нажмите «Загрузить TXT/RTF/LEX» и выберите текст (или сохранённый словарь LEX).<br>"
             "— Программа автоматически:<br>"
             "&nbsp;&nbsp;• разобьёт текст на предложения,<br>"
             "&nbsp;&nbsp;• извлечёт лексемы (нормальные формы),<br>"
@@ -434,7 +735,8 @@ class LexiconEditor(QMainWindow):
             "— Поиск нечувствителен к регистру.</p>"
             
             "<p><b>5. Сохранение и документирование</b><br>"
-            "— «Сохранить словарь» — экспорт в JSON для программной обработки.<br>"
+            "— «Сохранить словарь» — экспорт в JSON для программной обработки<br>"
+            "&nbsp;&nbsp;или сохранение в двоичный LEX, который можно снова открыть через «Загрузить».<br>"
             "— «Документировать» — создание читаемого отчёта в TXT с пояснениями.<br>"
             "— Оба формата поддерживают кириллицу без искажений.</p>"
             
@@ -471,7 +773,7 @@ class LexiconEditor(QMainWindow):
             
             "<p><b>Ключевые улучшения по сравнению с базовой версией:</b></p>"
             "<ul>"
-            "<li>✓ Разбиение текста на предложения через NLTK (sent_tokenize)</li>"
+            "<li>✓ Разбиение текста на предложения (регулярное выражение или NLTK sent_tokenize)</li>"
             "<li>✓ Сохранение дефисных слов при токенизации</li>"
             "<li>✓ Расширенная фильтрация стоп-слов и артефактов частиц</li>"
             "<li>✓ Учёт только знаменательных частей речи (NOUN, VERB, ADJF и др.)</li>"